@@ -13,7 +13,8 @@ const MessageFeedback = ({ message }) => {
   const handleThumbsUp = async () => {
     if (feedbackGiven) return; // Already gave feedback
 
-    setIsSubmitting(true);
+    // Optimistic: acknowledge immediately, roll back if the submit fails
+    setFeedbackGiven('up');
     try {
       await submitFeedback({
         type: 'thumbs_up',
@@ -22,12 +23,10 @@ const MessageFeedback = ({ message }) => {
         sql_query: message.sql_query,
         timestamp: new Date().toISOString()
       });
-      setFeedbackGiven('up');
     } catch (error) {
+      setFeedbackGiven(null);
       const friendlyError = error.message || getUserFriendlyError(error, 'feedback');
       alert(friendlyError);
-    } finally {
-      setIsSubmitting(false);
     }
   };
 
@@ -122,7 +122,11 @@ const StreamingMessage = React.memo(({
     try {
       // Use the database stored with the message, or default to 'sample'
       const database = message.database || 'sample';
-      const data = await fetchInterpretation(message.query_id, database);
+      const data = await fetchInterpretation(
+        message.query_id,
+        database,
+        message.display_info?.total_in_dataset
+      );
       onUpdateAnalysis(message.id, data);
     } catch (error) {
       const friendlyError = error.message || getUserFriendlyError(error, 'general');
@@ -253,6 +257,7 @@ StreamingMessage.propTypes = {
     analysis_explanation: PropTypes.string,
     visualization_path: PropTypes.string,
     results: PropTypes.any,
+    display_info: PropTypes.object,
     isError: PropTypes.bool,
     isLoading: PropTypes.bool,
     suggestedQueries: PropTypes.arrayOf(PropTypes.string),
@@ -3,6 +3,21 @@ import { queryAgent } from '../services/api';
 import { debugLog } from '../utils/debug';
 import { getUserFriendlyError } from '../utils/errorMessages';
 
+// Message ids are React keys and route stream events to their placeholder,
+// so they must never repeat. Date.now() alone repeats within a millisecond;
+// this keeps ids time-ordered but strictly increasing.
+let lastMessageId = 0;
+const nextMessageId = () => {
+  lastMessageId = Math.max(lastMessageId + 1, Date.now());
+  return lastMessageId;
+};
+
+// Markdown for the SQL section. Newer backends send only the raw `sql` in the
+// `sql` event and leave the fenced `explanation` for the client to derive.
+const formatSqlExplanation = (sql) => (
+  sql ? `**SQL Query:**\n\`\`\`sql\n${sql}\n\`\`\`\n\n` : ''
+);
+
 export const useChat = (database = 'sample') => {
   const [messages, setMessages] = useState([]);
   const [loading, setLoading] = useState(false);
@@ -12,7 +27,7 @@ export const useChat = (database = 'sample') => {
     if (!query.trim() || loading) return;
 
     const userMessage = {
-      id: Date.now(),
+      id: nextMessageId(),
       content: query,
       timestamp: new Date().toISOString(),
       isUser: true
@@ -23,7 +38,7 @@ export const useChat = (database = 'sample') => {
     setLoading(true);
 
     // Create placeholder agent message that will be updated progressively
-    const agentMessageId = Date.now() + 1;
+    const agentMessageId = nextMessageId();
     const initialAgentMessage = {
       id: agentMessageId,
       content: '',
@@ -68,7 +83,7 @@ export const useChat = (database = 'sample') => {
               msg.id === agentMessageId
                 ? {
                     ...msg,
-                    sql_explanation: event.explanation,
+                    sql_explanation: event.explanation ?? formatSqlExplanation(event.sql),
                     sql_query: event.sql,
                     query_id: event.query_id,
                     user_question: query,
@@ -219,7 +234,7 @@ export const useChat = (database = 'sample') => {
 
       const friendlyMessage = error.message || getUserFriendlyError(error, 'general');
       const errorMessage = {
-        id: Date.now() + 1,
+        id: nextMessageId(),
         content: friendlyMessage,
         timestamp: new Date().toISOString(),
         isUser: false,
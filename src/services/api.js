@@ -85,18 +85,24 @@ export const queryAgent = async (query, sessionId = null, onEvent, database = 's
 
         const reader = response.body.getReader();
         const decoder = new TextDecoder();
-        let buffer = '';
+        // Pieces of the current partial line. Large `data` events span many
+        // reads, so pieces are only joined and split once a newline arrives
+        // rather than rescanning the accumulated event on every read.
+        let pending = [];
 
         while (true) {
             const { done, value } = await reader.read();
 
             if (done) break;
 
-            buffer += decoder.decode(value, { stream: true });
-            const lines = buffer.split('\n');
+            const chunk = decoder.decode(value, { stream: true });
+            pending.push(chunk);
+            if (!chunk.includes('\n')) continue;
 
-            // Keep the last partial line in the buffer
-            buffer = lines.pop() || '';
+            const lines = pending.join('').split('\n');
+
+            // Keep the last partial line pending
+            pending = [lines.pop()];
 
             for (const line of lines) {
                 if (line.startsWith('data: ')) {
@@ -125,27 +131,66 @@ export const queryAgent = async (query, sessionId = null, onEvent, database = 's
     }
 };
 
+// How long a fetched schema overview is reused before asking the backend again
+const SCHEMA_OVERVIEW_TTL_MS = 300_000;
+
+// One entry per database: { promise, fetchedAt }. Caching the promise (not
+// the result) also coalesces concurrent requests for the same database.
+const schemaOverviewCache = new Map();
+
 /**
  * Fetch the schema overview from the backend
+ *
+ * Results are reused per database for SCHEMA_OVERVIEW_TTL_MS, after which
+ * the next call refetches (letting the browser cache revalidate). Failed
+ * requests are evicted so the next call retries.
+ *
  * @param {string} database - The database name (e.g., 'sample', 'neila')
  * @returns {Promise<Object>} Schema overview data
  */
-export const fetchSchemaOverview = async (database = 'sample') => {
-    try {
-        const response = await fetch(`${getApiUrl(database)}/api/schema/overview?database=${encodeURIComponent(database)}`);
-        if (!response.ok) {
-            throw new Error(`Failed to fetch schema: ${response.statusText}`);
-        }
-        return await response.json();
-    } catch (error) {
-        console.error('Error fetching schema overview:', error);
-        throw error;
+export const fetchSchemaOverview = (database = 'sample') => {
+    const cached = schemaOverviewCache.get(database);
+    if (cached && Date.now() - cached.fetchedAt < SCHEMA_OVERVIEW_TTL_MS) {
+        return cached.promise;
     }
+
+    const entry = { fetchedAt: Date.now() };
+    entry.promise = (async () => {
+        try {
+            const response = await fetch(`${getApiUrl(database)}/api/schema/overview?database=${encodeURIComponent(database)}`);
+            if (!response.ok) {
+                throw new Error(`Failed to fetch schema: ${response.statusText}`);
+            }
+            return await response.json();
+        } catch (error) {
+            // Only evict our own entry; a newer request may have replaced it
+            if (schemaOverviewCache.get(database) === entry) {
+                schemaOverviewCache.delete(database);
+            }
+            console.error('Error fetching schema overview:', error);
+            throw error;
+        }
+    })();
+
+    schemaOverviewCache.set(database, entry);
+    return entry.promise;
 };
 
-export const fetchInterpretation = async (queryId, database = 'sample') => {
+/**
+ * Fetch analysis and visualization for a previously executed query
+ * @param {string} queryId - The query_id from the `sql` event
+ * @param {string} database - The database the query ran against
+ * @param {number} [totalCount] - Total row count from `display_info`, if known.
+ *   Lets the backend skip re-executing the query just to count rows.
+ * @returns {Promise<Object>} Interpretation data
+ */
+export const fetchInterpretation = async (queryId, database = 'sample', totalCount = null) => {
     try{
-        const response = await fetch(`${getApiUrl(database)}/api/interpret/${queryId}?database=${encodeURIComponent(database)}`);
+        const params = new URLSearchParams({ database });
+        if (Number.isInteger(totalCount)) {
+            params.set('total_count', String(totalCount));
+        }
+        const response = await fetch(`${getApiUrl(database)}/api/interpret/${queryId}?${params}`);
         if (!response.ok) {
             const error = new Error(`HTTP ${response.status}: ${response.statusText}`);
             throw error;